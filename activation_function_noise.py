@@ -5,7 +5,6 @@ import argparse
 import matplotlib.pyplot as plt
 import numpy as np
 from numpy import exp, array, random
-from pprint import pprint
 
 _input_range = (-10, 10)
 _sigmoid_region = (-7, 7)
@@ -28,10 +27,10 @@ def activation_test(input_range, sigmoid_region, non_sigmoid_tick_interval, sigm
     input_start, input_end = input_range
     sigmoid_start, sigmoid_end = sigmoid_region
 
-    inputs = np.linspace(input_start, input_end, int((input_end - input_start) / non_sigmoid_tick_interval))
+    non_sigmoid_inputs = np.linspace(input_start, input_end, int((input_end - input_start) / non_sigmoid_tick_interval))
+    sigmoid_inputs = np.linspace(sigmoid_start, sigmoid_end, int((sigmoid_end-sigmoid_start) / sigmoid_tick_interval))
 
-    for i in range (0, points_per_sigmoid_tick):
-        inputs = np.append(inputs, np.linspace(sigmoid_start, sigmoid_end, int((sigmoid_end-sigmoid_start) / sigmoid_tick_interval)))
+    inputs = np.concatenate([non_sigmoid_inputs] + [sigmoid_inputs] * points_per_sigmoid_tick)
 
     outputs = sigmoid(inputs)
 
@@ -41,8 +40,6 @@ def main():
     inputs, outputs = activation_test(_input_range, _sigmoid_region, _non_sigmoid_tick_interval, _sigmoid_tick_interval, _points_per_sigmoid_tick)
 
     plot_activation(inputs, outputs)
-    # pprint(inputs)
-    # pprint(outputs)
 
 if __name__ == '__main__':
     main()
@@ -39,28 +39,21 @@ def load_data_pair(images_path, labels_path, width):
     letter1 = ord(letter1) - ord('a') + 1
     letter2 = ord(letter2) - ord('a') + 1
 
-    indices = np.argwhere(Y == letter1)
-    indices = np.append(indices, np.argwhere(Y == letter2))
+    indices = np.flatnonzero(np.isin(Y, (letter1, letter2)))
 
     np.random.shuffle(indices)
 
-    X_ucf_list = [(zoom(arr.reshape(28, 28), (width/28.0))).flatten() for arr in X[indices]]
-    X_ucf = np.array(X_ucf_list)
+    X_ucf = np.empty((len(indices), width * width), dtype=X.dtype)
 
-    Y_ucf = Y[indices]
+    for i, arr in enumerate(X[indices]):
+        X_ucf[i] = zoom(arr.reshape(28, 28), (width/28.0)).ravel()
 
-    one_hot_lookup = {
-        letter1 : np.array([1, 0]),
-        letter2 : np.array([0, 1])
-        }
+    Y_ucf = Y[indices]
 
-    # one_hot_lookup = {
-    #     1 : np.array([1, 0, 0]),
-    #     2 : np.array([0, 1, 0]),
-    #     3 : np.array([0, 0, 1])
-    #     }
+    one_hot_classes = np.array([letter1, letter2])
 
-    Y_ucf_one_hot = np.array([one_hot_lookup[n] for n in Y_ucf])
+    # Broadcast the labels against the class list to build every one-hot row at once
+    Y_ucf_one_hot = (Y_ucf[:, np.newaxis] == one_hot_classes).astype(int)
 
     return X_ucf, Y_ucf_one_hot
 
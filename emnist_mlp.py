@@ -7,7 +7,6 @@ import matplotlib.pyplot as plt
 import numpy as np
 import os
 from numpy import exp, array, random, dot, argmax
-from pprint import pprint
 
 
 parser = argparse.ArgumentParser(
@@ -34,6 +33,9 @@ _validation_iterations = 2000
 _validation_tick_interval = 1
 _max_weight = 10.0
 
+# Print intermediate values while validating
+_DEBUG = False
+
 _emnist_path = os.path.join(os.getcwd(), 'emnist_data')
 
 # Standard deviation for activation noise
@@ -79,16 +81,16 @@ class NeuronLayer():
         max_weight = _max_weight
 
         self.synaptic_weights += adjustments
-        abs_weights = np.abs(self.synaptic_weights)
-        if (abs_weights > max_weight).any():
-            self.synaptic_weights *= _max_weight / (abs_weights).max()
+        peak_weight = np.abs(self.synaptic_weights).max()
+        if peak_weight > max_weight:
+            self.synaptic_weights *= max_weight / peak_weight
 
 class NeuralNetwork():
     def __init__(self, neuron_layers):
         self.neuron_layers = neuron_layers
 
-    def activation_function(self, x):
-        return self.sigmoid(x)
+        # The noise setting is fixed for the run, so pick the activation once
+        self.activation_function = self.noisy_sigmoid if _args.noisy_activation else self.sigmoid
 
     def activation_derivative(self, x):
         return self.sigmoid_derivative(x)
@@ -103,11 +105,14 @@ class NeuralNetwork():
     # We pass the weighted sum of the inputs through this function to
     # normalise them between 0 and 1.
     def sigmoid(self, x):
-        if _args.noisy_activation == True:
-            x += random.normal(0, _standard_deviation, x.shape)
-
         return 1 / (1 + exp(-x))
 
+    # The Sigmoid function with simulated Gaussian noise added to its input.
+    def noisy_sigmoid(self, x):
+        x += random.normal(0, _standard_deviation, x.shape)
+
+        return self.sigmoid(x)
+
     # The derivative of the Sigmoid function.
     # This is the gradient of the Sigmoid curve.
     # It indicates how confident we are about the existing weight.
@@ -132,7 +137,6 @@ class NeuralNetwork():
             # Shuffle the training set
             data_set_size = training_set_inputs.shape[0]
             indices = np.random.permutation(data_set_size)[0:batch_size]
-            # print(indices)
             training_set_inputs = training_set_inputs[indices]
             training_set_outputs = training_set_outputs[indices]
 
@@ -189,20 +193,11 @@ class NeuralNetwork():
         return accuracy_by_epoch
 
     def validate(self, test_inputs, test_outputs, indices):
-        correct_predictions = 0
-
-        for index in indices:
-            outputs = neural_network.think(array(test_inputs[index]))
+        # Run the whole validation sample through the network as one batch
+        outputs = self.think(test_inputs[indices])
+        predictions = np.argmax(outputs[-1], axis=1)
 
-            # print([outputs[-1]])
-            # probabilities = softmax([outputs[-1]])
-            prediction = np.argmax([outputs[-1]],axis=1)[0]
-            # print(f"{prediction}: {test_outputs[index]}")
-
-            if test_outputs[index][prediction] == 1:
-                correct_predictions += 1.0
-
-        # print(correct_predictions / len(indices) * 100.0)
+        correct_predictions = np.count_nonzero(test_outputs[indices, predictions] == 1)
 
         return correct_predictions / len(indices) * 100.0
 
@@ -222,9 +217,6 @@ class NeuralNetwork():
             output_tensors.append(output)
             input_tensors.append(output)
 
-        # output_tensors[-1] = softmax(output_tensors[-1])
-
-
         return output_tensors
 
     # The neural network prints its weights
@@ -276,7 +268,6 @@ if __name__ == "__main__":
     )
 
     print("Stage 2) New synaptic weights after training: ")
-    # neural_network.print_weights()
 
     if _args.plot:
         plot_accuracy(accuracy_by_epoch)
@@ -288,31 +279,11 @@ if __name__ == "__main__":
 
     sample_labels = [prediction_labels[x] for x in np.argmax(validation_set_outputs[0:sample_size],axis=1)]
 
-    sample_outputs = [neural_network.think(x)[-1] for x in sample_inputs]
-
-    # print([x for x in sample_inputs])
-    # print(sample_outputs)
-    # print([prediction_labels[x] for x in np.argmax(sample_outputs, axis=1)])
+    sample_outputs = neural_network.think(sample_inputs)[-1]
 
     sample_preds = [prediction_labels[x] for x in np.argmax(sample_outputs, axis=1)]
-    #
-    # print(sample_preds)
-    #
-    print(sample_outputs)
-    plot_data_samples(sample_inputs, sample_labels, sample_preds, width)
 
+    if _DEBUG:
+        print(sample_outputs)
 
-    # for input_set in validation_set_inputs[0:5]:
-    #     ticks = ["X" if x > 0.5 else " " for x in input_set]
-    #
-    #     outputs = neural_network.think(array(input_set))
-    #     # probs = softmax([outputs[-1]])
-    #     preds = np.argmax([outputs[-1]],axis=1)
-    #
-    #     print(f"           _______________       ")
-    #     print(f"          |       |       |      Prediction: {prediction_labels[preds[0]]}")
-    #     print("          |   {}   |   {}   |".format(ticks[0], ticks[1]))
-    #     print("          |_______|_______|")
-    #     print("          |       |       |")
-    #     print("          |   {}   |   {}   |".format(ticks[2], ticks[3]))
-    #     print("          |_______|_______|\n\n")
+    plot_data_samples(sample_inputs, sample_labels, sample_preds, width)
@@ -4,7 +4,7 @@
 import argparse
 import numpy as np
 from numpy import array
-import random
+import os
 
 parser = argparse.ArgumentParser(description='Create a line-orientation dataset.')
 parser.add_argument('length', type=int,
@@ -35,6 +35,8 @@ _args = parser.parse_args()
 #
 # Each sample square will have two pixels of value 1 (on) and two pixels of value 0 (off).
 
+_line_template = '{} {} {} {} {}\n'
+
 def analogify(data):
     high_value_mean = 0.75
     low_value_mean = 0.25
@@ -61,7 +63,14 @@ class squareGenerator():
         self.squares.append(('D', array([1, 0, 0, 1])))
 
     def createList(self, length):
-        return [analogify(random.choice(self.squares)) for x in range(1, length)]
+        labels, squares = zip(*self.squares)
+
+        # Draw every sample up front so analogify runs once over the whole dataset
+        choices = np.random.randint(0, len(self.squares), length)
+
+        new_labels, new_values = analogify((array(labels)[choices], array(squares)[choices]))
+
+        return list(zip(new_labels, new_values))
 
 def main():
     dataset_size = _args.length
@@ -70,21 +79,20 @@ def main():
 
     dataset = square_generator.createList(dataset_size)
 
-    dataset_output = []
-
-    for label, values in dataset:
-        # line = f"{label}"
-
-        # for value in values:
-        #     line = f"{line}, {values}"
-        value_string = f"{values}"[1:-1]
+    dataset_output = ''.join(_line_template.format(label, *values) for label, values in dataset)
 
-        line = f"{label} {value_string}\n"
+    # Write to a temporary file first so a reader never sees a partial dataset
+    temp_filename = f'{_args.filename}.tmp'
 
-        dataset_output.append(line)
+    try:
+        with open(temp_filename, 'w') as f:
+            f.write(dataset_output)
 
-    with open(_args.filename, 'w') as f:
-        f.writelines(dataset_output)
+        os.replace(temp_filename, _args.filename)
+    except BaseException:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
 
 if __name__ == '__main__':
     main()
@@ -5,7 +5,6 @@ import argparse
 import matplotlib.pyplot as plt
 import numpy as np
 from numpy import exp, array, random, dot, argmax
-from pprint import pprint
 
 
 parser = argparse.ArgumentParser(
@@ -28,13 +27,33 @@ _args = parser.parse_args()
 _training_data_file = "training_set.txt"
 _validation_data_file = "validation_set.txt"
 
+# One-hot encodings for the labels used in the data files
+_output_encodings = {
+    "V" : [1, 0, 0],
+    "H" : [0, 1, 0],
+    "D" : [0, 0, 1]
+}
+
 _validation_iterations = 50
 _validation_tick_interval = 10
 _max_weight = 10.0
 
+# Print intermediate values while training and loading data
+_DEBUG = False
+
 # Standard deviation for activation noise
 _standard_deviation = 0.15
 
+# Console drawing of a 2x2 input square and its prediction
+_square_template = '\n'.join([
+    "           _______________       ",
+    "          |       |       |      Prediction: {prediction}",
+    "          |   {0}   |   {1}   |",
+    "          |_______|_______|",
+    "          |       |       |",
+    "          |   {2}   |   {3}   |",
+    "          |_______|_______|\n\n"])
+
 def plot_accuracy(accuracy_by_epoch):
     epoch, accuracy = accuracy_by_epoch
     plt.plot(epoch, accuracy)
@@ -62,16 +81,16 @@ class NeuronLayer():
         max_weight = _max_weight
 
         self.synaptic_weights += adjustments
-        abs_weights = np.abs(self.synaptic_weights)
-        if (abs_weights > max_weight).any():
-            self.synaptic_weights *= _max_weight / (abs_weights).max()
+        peak_weight = np.abs(self.synaptic_weights).max()
+        if peak_weight > max_weight:
+            self.synaptic_weights *= max_weight / peak_weight
 
 class NeuralNetwork():
     def __init__(self, neuron_layers):
         self.neuron_layers = neuron_layers
 
-    def activation_function(self, x):
-        return self.sigmoid(x)
+        # The noise setting is fixed for the run, so pick the activation once
+        self.activation_function = self.noisy_sigmoid if _args.noisy_activation else self.sigmoid
 
     def activation_derivative(self, x):
         return self.sigmoid_derivative(x)
@@ -80,11 +99,14 @@ class NeuralNetwork():
     # We pass the weighted sum of the inputs through this function to
     # normalise them between 0 and 1.
     def sigmoid(self, x):
-        if _args.noisy_activation == True:
-            x += random.normal(0, _standard_deviation, x.shape)
-
         return 1 / (1 + exp(-x))
 
+    # The Sigmoid function with simulated Gaussian noise added to its input.
+    def noisy_sigmoid(self, x):
+        x += random.normal(0, _standard_deviation, x.shape)
+
+        return self.sigmoid(x)
+
     # The derivative of the Sigmoid function.
     # This is the gradient of the Sigmoid curve.
     # It indicates how confident we are about the existing weight.
@@ -109,7 +131,8 @@ class NeuralNetwork():
             # Shuffle the training set
             data_set_size = training_set_inputs.shape[0]
             indices = np.random.permutation(data_set_size)[0:batch_size]
-            print(indices)
+            if _DEBUG:
+                print(indices)
             training_set_inputs = training_set_inputs[indices]
             training_set_outputs = training_set_outputs[indices]
 
@@ -161,15 +184,11 @@ class NeuralNetwork():
         return accuracy_by_epoch
 
     def validate(self, test_inputs, test_outputs, indices):
-        correct_predictions = 0
-
-        for index in indices:
-            outputs = neural_network.think(array(test_inputs[index]))
-            # probabilities = softmax([outputs[-1]])
-            prediction = np.argmax([outputs[-1]],axis=1)[0]
+        # Run the whole validation sample through the network as one batch
+        outputs = self.think(test_inputs[indices])
+        predictions = np.argmax(outputs[-1], axis=1)
 
-            if test_outputs[index][prediction] == 1:
-                correct_predictions += 1.0
+        correct_predictions = np.count_nonzero(test_outputs[indices, predictions] == 1)
 
         return correct_predictions / len(indices) * 100.0
 
@@ -201,27 +220,21 @@ class NeuralNetwork():
             print(layer.synaptic_weights)
 
 def load_data(filename):
-    output_dict = {
-        "V" : [1, 0, 0],
-        "H" : [0, 1, 0],
-        "D" : [0, 0, 1]
-    }
+    output_dict = _output_encodings
 
     inputs = []
     outputs = []
 
     with open(filename, 'r') as f:
-        data_lines = f.readlines()
-
-        for line in data_lines:
+        for line in f:
             data = line.split()
 
             outputs.append(output_dict[data[0]])
             inputs.append([float(x) for x in data[1:]])
 
-    #DEBUG
-    print(inputs[0])
-    print(outputs[0])
+    if _DEBUG:
+        print(inputs[0])
+        print(outputs[0])
 
     return array(inputs), array(outputs)
 
@@ -307,10 +320,4 @@ if __name__ == "__main__":
         # probs = softmax([outputs[-1]])
         preds = np.argmax([outputs[-1]],axis=1)
 
-        print(f"           _______________       ")
-        print(f"          |       |       |      Prediction: {prediction_labels[preds[0]]}")
-        print("          |   {}   |   {}   |".format(ticks[0], ticks[1]))
-        print("          |_______|_______|")
-        print("          |       |       |")
-        print("          |   {}   |   {}   |".format(ticks[2], ticks[3]))
-        print("          |_______|_______|\n\n")
+        print(_square_template.format(*ticks, prediction=prediction_labels[preds[0]]))
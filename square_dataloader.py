@@ -15,16 +15,14 @@ class LineOrientationDataset(Dataset):
 
     def _init_dataset(self):
         with open(self.data_file, 'r') as f:
-            data_lines = f.readlines()
+            for line in f:
+                data = line.split()
 
-        for line in data_lines:
-            data = line.split()
+                label = data[0]
 
-            label = data[0]
+                bitmap = [int(data[x]) for x in range(1, 5)]
 
-            bitmap = [int(data[x]) for x in range(1, 5)]
-
-            self.samples.append(label, bitmap)
+                self.samples.append(label, bitmap)
 
 
 